@@ -1,18 +1,112 @@
 import csv
+from contextlib import contextmanager
+from functools import partial
+import gzip
+import hashlib
+import io
+from itertools import chain, filterfalse, islice
+from operator import itemgetter
 from pynytimes import NYTAPI
+import numpy as np
 import pandas as pd
 from datetime import datetime
+import atexit
 import logging
+import logging.handlers
 import json
+import os
+import queue
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 
-# Set up logging
-logging.basicConfig(
-    level = logging.INFO,
-    format = '%(asctime)s - %(levelname)s - %(message)s',
-    filename = 'nyt_extraction.log'
-)
+# orjson is optional, it parses responses and serializes nested article fields several times faster
+# than the json module
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+
+    _loads = orjson.loads
+except ImportError:
+    # Match orjson's compact, unescaped output so csv cells and cache files don't depend on which is installed
+    _dumps = partial(json.dumps, separators = (',', ':'), ensure_ascii = False)
+    _loads = json.loads
+
+_keyword_value = itemgetter('value')
+
+# Set up logging, records are queued and written to the log file by a background thread.
+# Like basicConfig, leave logging alone if the application (or an earlier import) already configured it
+if not logging.getLogger().handlers:
+    _log_queue = queue.Queue(-1)
+    _file_handler = logging.handlers.RotatingFileHandler('nyt_extraction.log', maxBytes = 10 << 20, backupCount = 3,
+                                                         encoding = 'utf-8')
+    _file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    _log_listener = logging.handlers.QueueListener(_log_queue, _file_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+    logging.getLogger().setLevel(logging.INFO)
+
+# NYT allows 5 requests per minute, so space request starts at least 12 seconds apart
+REQUEST_INTERVAL = 12.0
+
+# Longest backoff taken from rate limit headers, so a bogus header can't stall a run for hours
+MAX_RATE_LIMIT_BACKOFF = 600.0
+
+# Dtype of text columns in processed articles, kept in arrow buffers instead of python objects
+STRING_DTYPE = 'string[pyarrow]'
+
+# Timestamp format of the NYT API, used to write parsed dates back out to csv unchanged
+PUB_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+
+# Buffer output files in 4 MiB chunks instead of the default 8 KB to cut down on write syscalls
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Number of csv rows formatted in memory before they are written out together
+CSV_BATCH_SIZE = 10000
+
+# Default compression levels, low levels keep most of the size reduction at a fraction of the write time
+GZIP_COMPRESSION_LEVEL = 1
+ZSTD_COMPRESSION_LEVEL = 3
+
+# Compressed extensions pandas would recognise but the csv writers don't support
+UNSUPPORTED_COMPRESSION_SUFFIXES = ('.bz2', '.xz', '.zip', '.zst', '.tar')
+
+@contextmanager
+def _open_output(filename, compresslevel = None):
+    """
+    Open a text file for writing behind a large buffer, gzip compressed if the filename ends with .gz
+    """
+    if compresslevel is None:
+        compresslevel = GZIP_COMPRESSION_LEVEL
+
+    # pandas would infer these from the extension, refuse them instead of writing plain text under that name
+    suffix = os.path.splitext(str(filename))[1].lower()
+    if suffix in UNSUPPORTED_COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression '{suffix}' for {filename}, use .gz or an uncompressed file")
+
+    with open(filename, 'wb', buffering = WRITE_BUFFER_SIZE) as raw:
+        if suffix == '.gz':
+            with gzip.GzipFile(fileobj = raw, mode = 'wb', compresslevel = compresslevel, mtime = 0) as gz, \
+                 io.TextIOWrapper(gz, encoding = 'utf-8', newline = '') as f:
+                yield f
+        else:
+            with io.TextIOWrapper(raw, encoding = 'utf-8', newline = '') as f:
+                yield f
+
+def _nested_getter(path):
+    """
+    Build a function that walks a pre-split nested path of a field value, returning None if it isn't there
+    """
+    def get(value):
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        return value
+    return get
 
 # Customize exception
 class FieldMissingError(Exception):
@@ -20,7 +114,41 @@ class FieldMissingError(Exception):
 
 class NYTArticleExtractor():
 
-    def __init__(self, api_key, base_url, fields = None):
+    __slots__ = ('api_key', 'base_url', 'fields', 'required_fields', 'cache_dir', 'cache_ttl',
+                 'session', '_next_request_time')
+
+    # Must have id, headline, and published date
+    REQUIRED_FIELDS = ('_id', 'headline', 'pub_date')
+
+    ALL_FIELDS = (
+        '_id', 'headline', 'byline', 'abstract', 'snippet', 'source', 'print_page', 'multimedia',
+        'document_type', 'web_url',
+        'pub_date', 'news_desk', 'section_name', 'subsection_name', 'type_of_material',
+        'word_count', 'uri',
+        'keywords', 'print_section'
+    )
+
+    # Output column and pre-split path of each nested field, so process_article doesn't split strings per article
+    NESTED_PATHS = (
+        ('headline', ('headline', 'main')),
+        ('headline_kicker', ('headline', 'kicker')),
+        ('headline_print', ('headline', 'print_headline')),
+        ('byline', ('byline', 'original')),
+        ('image_url', ('multimedia', 'default', 'url'))
+    )
+
+    # Fields copied straight from the article, the rest are extracted separately in process_article
+    SKIP_IN_OPTIONAL = frozenset(('headline', 'byline', 'multimedia', 'keywords'))
+    _OPTIONAL_FIELDS = tuple(filterfalse(SKIP_IN_OPTIONAL.__contains__, ALL_FIELDS))
+
+    # Column order of a processed article
+    _OUTPUT_COLUMNS = tuple(out_key for out_key, _ in NESTED_PATHS) + ('keywords',) + _OPTIONAL_FIELDS
+
+    # Columns parsed into numbers and timestamps in _to_dataframe, every other output column is text
+    NON_STRING_COLUMNS = frozenset(('word_count', 'pub_date'))
+    _STRING_COLUMNS = tuple(filterfalse(NON_STRING_COLUMNS.__contains__, _OUTPUT_COLUMNS))
+
+    def __init__(self, api_key, base_url = None, fields = None, cache_dir = '.nyt_cache', cache_ttl = 24 * 60 * 60):
         """
         Initialize the NYT article extractor
 
@@ -28,101 +156,246 @@ class NYTArticleExtractor():
             api_key (str): NYT API key
             base_url (str): NYT API url, default is the Article Search API url
             fields (list): fields that must be present for each article
+            cache_dir (str): directory to cache fetched pages in, None disables the cache
+            cache_ttl (int): seconds a cached page stays valid, default is one day
         """
         # self.nyt = NYTAPI(api_key, parse_dates = True)
         self.api_key = api_key
         self.base_url = base_url or 'https://api.nytimes.com/svc/search/v2/articlesearch.json'
-        self.fields = ['_id', 'headline', 'pub_date'] or fields # Must have id, headline, and published date
-        self.all_fields = [
-            '_id', 'headline', 'byline', 'abstract', 'snippet', 'source', 'print_page', 'multimedia',
-            'document_type', 'web_url',
-            'pub_date', 'news_desk', 'section_name', 'subsection_name', 'type_of_material',
-            'word_count', 'uri',
-            'keywords', 'print_section'
-        ]
+        self.fields = fields or list(self.REQUIRED_FIELDS)
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        # Required fields that show up in a processed article and can be checked there
+        self.required_fields = tuple(f for f in self.fields if f in self._OUTPUT_COLUMNS)
+
+        # Reuse one connection across pages instead of a new TCP/TLS handshake per request
+        self.session = requests.Session()
+        retries = Retry(
+            total = 5,
+            backoff_factor = 1.0,
+            status_forcelist = (429, 500, 502, 503, 504),
+            allowed_methods = frozenset(['GET'])
+        )
+        adapter = HTTPAdapter(pool_connections = 1, pool_maxsize = 4, max_retries = retries)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip',
+            'User-Agent': 'nyt-extractor/1.0'
+        })
+        # Earliest time the next request may start, shared by every search made with this extractor
+        self._next_request_time = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections
+        """
+        self.session.close()
 
-    def search_articles(self, query, begin_date, end_date, results = 10, start_page = 0):
+    def iter_articles(self, query, begin_date, end_date, results = 10, start_page = 0, use_cache = True):
         """
-        Search for articles based on query and date range
-        
+        Fetch articles based on query and date range, yielding them page by page as they come in
+
         Args:
             query (str): search query
             begin_date (str): beginning of date range, format YYYYMMDD
             end_date (str): end of date range, format YYYYMMDD
             results (int): number of results to return, default is 10
             start_page (int): index of start page, default is 0
+            use_cache (bool): if True, reuse pages already fetched with the same arguments
 
-        Returns:
-            list: raw article data from NYT API
+        Yields:
+            dict: raw article data from NYT API, without duplicates
         """
-        try:
-            all_articles = []
-            seen_ids = set()
-
-            pages_needed = (results + 9) // 10 # only 10 results per page per request
+        retrieved = 0
+        seen_ids = set()
 
-            pages_needed = min(pages_needed, 100) # limit to 100 pages
+        pages_needed = (results + 9) // 10 # only 10 results per page per request
 
-            logging.info(f"Fetching up to {results} articles across {pages_needed} pages")
+        pages_needed = min(pages_needed, 100) # limit to 100 pages
 
-            for page in range(start_page, pages_needed):
-                params = {
-                    'api-key': self.api_key,
-                    'q': query,
-                    'page': page
-                }
+        logging.info(f"Fetching up to {results} articles across {pages_needed} pages")
 
-                if begin_date:
-                    params['begin_date'] = begin_date
+        for page in range(start_page, start_page + pages_needed):
+            articles = self._fetch_page(query, begin_date, end_date, page, use_cache)
 
-                if end_date:
-                    params['end_date'] = end_date
+            if not articles:
+                logging.info(f"No more articles found after page {page}")
+                break
 
-                response = requests.get(self.base_url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            if page > start_page:
+                current_ids = {article.get('_id') for article in articles}
+                overlap = current_ids.intersection(seen_ids)
+                if overlap:
+                    logging.debug(f"Page {page} has {len(overlap)} overlapping articles with previous pages")
 
-                articles = data['response']['docs']
+            unique_articles = []
+            duplicates = 0
 
-                if not articles:
-                    logging.info(f"No more articles found after page {page}")
-                    break
-
-                if page > start_page:
-                    current_ids = {article.get('_id') for article in articles}
-                    overlap = current_ids.intersection(seen_ids)
-                    if overlap:
-                        logging.info(f"Page {page} has {len(overlap)} overlapping articles with previous pages")
+            for article in articles:
+                article_id = article.get('_id')
+                if article_id and article_id not in seen_ids:
+                    seen_ids.add(article_id)
+                    unique_articles.append(article)
+                else:
+                    duplicates += 1
 
-                unique_articles = []
-                duplicates = 0
+            logging.debug(f"Retrieved {len(unique_articles)} unique articles from page {page}")
 
-                for article in articles:
-                    article_id = article.get('_id')
-                    if article_id and article_id not in seen_ids:
-                        seen_ids.add(article_id)
-                        unique_articles.append(article)
-                    else:
-                        duplicates += 1
+            unique_articles = unique_articles[:results - retrieved]
+            retrieved += len(unique_articles)
+            yield from unique_articles
 
-                all_articles.extend(unique_articles)
-                logging.info(f"Retrieved {len(unique_articles)} unique articles from page {page}")
+            if retrieved >= results:
+                break
 
-            
-                if len(all_articles) >= results:
-                    all_articles = all_articles[:results]
-                    break
+        logging.info(f"Total articles retrieved: {retrieved} for query: '{query}'")
 
-                if page < start_page + pages_needed - 1:
-                    time.sleep(12)
+    def search_articles(self, query, begin_date, end_date, results = 10, start_page = 0, use_cache = True):
+        """
+        Search for articles based on query and date range
+        
+        Args:
+            query (str): search query
+            begin_date (str): beginning of date range, format YYYYMMDD
+            end_date (str): end of date range, format YYYYMMDD
+            results (int): number of results to return, default is 10
+            start_page (int): index of start page, default is 0
+            use_cache (bool): if True, reuse pages already fetched with the same arguments
 
-            logging.info(f"Total articles retrieved: {len(all_articles)} for query: '{query}")
-            return all_articles
+        Returns:
+            list: raw article data from NYT API
+        """
+        try:
+            return list(self.iter_articles(query, begin_date, end_date, results, start_page, use_cache))
         
         except Exception as e:
                 print(f"Error searching articles: {e}")
                 return []
 
+    def _fetch_page(self, query, begin_date, end_date, page, use_cache = True):
+        """
+        Fetch a single page of search results, served from the disk cache when possible
+
+        Args:
+            query (str): search query
+            begin_date (str): beginning of date range, format YYYYMMDD
+            end_date (str): end of date range, format YYYYMMDD
+            page (int): index of the page
+            use_cache (bool): if True, read and write the disk cache
+
+        Returns:
+            list: raw articles on the page
+        """
+        cache_path = None
+
+        if use_cache and self.cache_dir:
+            key = hashlib.sha256(f"{self.base_url}|{query}|{begin_date}|{end_date}|{page}".encode('utf-8')).hexdigest()
+            cache_path = os.path.join(self.cache_dir, f"{key}.json")
+            try:
+                if time.time() - os.path.getmtime(cache_path) < self.cache_ttl:
+                    with open(cache_path, 'rb') as f:
+                        articles = _loads(f.read())
+                    logging.debug(f"Loaded page {page} from cache")
+                    return articles
+            except (OSError, ValueError):
+                pass # not cached yet, expired or unreadable
+
+        params = {
+            'api-key': self.api_key,
+            'q': query,
+            'page': page
+        }
+
+        if begin_date:
+            params['begin_date'] = begin_date
+
+        if end_date:
+            params['end_date'] = end_date
+
+        # Only wait for whatever is left of the interval since the last request started
+        now = time.monotonic()
+        if now < self._next_request_time:
+            time.sleep(self._next_request_time - now)
+
+        request_start = time.monotonic()
+        response = self.session.get(self.base_url, params=params, timeout=(5, 30))
+        response.raise_for_status()
+        self._next_request_time = max(request_start + REQUEST_INTERVAL,
+                                      time.monotonic() + self.rate_limit_backoff(response))
+        # Parse the raw bytes directly, skipping requests' charset detection
+        data = _loads(response.content)
+
+        articles = data['response']['docs']
+
+        if cache_path:
+            try:
+                os.makedirs(self.cache_dir, exist_ok = True)
+                tmp_path = f"{cache_path}.tmp"
+                with open(tmp_path, 'w', encoding = 'utf-8') as f:
+                    f.write(_dumps(articles))
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logging.warning(f"Could not cache page {page}: {str(e)}")
+
+        return articles
+
+    def search_multiple_articles(self, queries, begin_date, end_date, results = 10, start_page = 0):
+        """
+        Search for articles for several queries over the same date range
+
+        All queries share the extractor's session and rate limit, so each query starts as soon as the
+        rate limit allows without going over the API quota
+
+        Args:
+            queries (list): search queries
+            begin_date (str): beginning of date range, format YYYYMMDD
+            end_date (str): end of date range, format YYYYMMDD
+            results (int): number of results to return per query, default is 10
+            start_page (int): index of start page, default is 0
+
+        Returns:
+            dict: raw article data from NYT API for each query
+        """
+        return {query: self.search_articles(query, begin_date, end_date, results, start_page) for query in queries}
+
+    def rate_limit_backoff(self, response):
+        """
+        Work out how long the API asks us to back off based on the rate limit headers
+
+        Args:
+            response (requests.Response): response of the last request
+
+        Returns:
+            float: seconds to wait from now, 0 if the API did not ask for a backoff
+        """
+        headers = response.headers
+        backoff = 0.0
+
+        try:
+            if 'Retry-After' in headers:
+                backoff = float(headers['Retry-After'])
+            elif headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in headers:
+                backoff = float(headers['X-RateLimit-Reset'])
+                # Some APIs send the reset time as an epoch timestamp rather than a number of seconds,
+                # no real delta is anywhere near 1e9 seconds (~31 years)
+                if backoff > 1e9:
+                    backoff -= time.time()
+        except ValueError:
+            logging.warning('Could not parse rate limit headers, falling back to the default interval')
+            return 0.0
+
+        if backoff > MAX_RATE_LIMIT_BACKOFF:
+            logging.warning(f"Rate limit backoff of {backoff:.0f}s is too long, waiting {MAX_RATE_LIMIT_BACKOFF:.0f}s instead")
+            backoff = MAX_RATE_LIMIT_BACKOFF
+
+        return max(backoff, 0.0)
+
     def extract_nested_field(self, article, field_path):
         """
         Extract a potentially nested field from an article
@@ -146,6 +419,31 @@ class NYTArticleExtractor():
                 
         return value
     
+    @staticmethod
+    def join_keywords(keywords):
+        """
+        Join the values of an article's keywords into a comma separated string
+
+        Args:
+            keywords (list): keywords of an article
+
+        Returns:
+            str: comma separated keyword values, empty string if there are none or they are malformed
+        """
+        if not isinstance(keywords, list) or not keywords:
+            return ''
+
+        try:
+            return ','.join(map(_keyword_value, keywords))
+        except (KeyError, TypeError):
+            pass
+
+        # Malformed keywords, skip entries that are not dicts and treat a missing value as empty
+        try:
+            return ','.join(kw.get('value', '') for kw in keywords if isinstance(kw, dict))
+        except TypeError:
+            return ''
+
     def process_article(self, article):
         """
         Process a single article and extract all possible fields
@@ -162,89 +460,301 @@ class NYTArticleExtractor():
         """
         processed = {}
 
-        processed['headline'] = self.extract_nested_field(article, 'headline.main')
-        processed['headline_kicker'] = self.extract_nested_field(article, 'headline.kicker')
-        processed['headline_print'] = self.extract_nested_field(article, 'headline.print_headline')
+        for out_key, path in self.NESTED_PATHS:
+            value = article
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            processed[out_key] = value
 
-        processed['byline'] = self.extract_nested_field(article, 'byline.original')
+        processed['keywords'] = self.join_keywords(article.get('keywords'))
 
-        processed['image_url'] = self.extract_nested_field(article, 'multimedia.default.url')
-        
-        if 'keywords' in article and article['keywords']:
+        for field in self._OPTIONAL_FIELDS:
+            value = article.get(field)
+            processed[field] = _dumps(value) if isinstance(value, (dict, list)) else value # Convert Python object to json string
+
+        # word_count sometimes comes back as a string, cast it once so writers get a real integer
+        word_count = processed['word_count']
+        if word_count is not None and not isinstance(word_count, int):
             try:
-                processed['keywords'] = ','.join([kw.get('value', '') for kw in article['keywords']])
-            except (AttributeError, TypeError):
-                processed['keywords'] = ''
-        else:
-            processed['keywords'] = ''
-
-        for field in self.all_fields:
-            if field not in ['headline', 'byline', 'multimedia', 'keywords']:
-                if field in article:
-                    if isinstance(article[field], (dict, list)):
-                        processed[field] = json.dumps(article[field]) # Convert Python object to json string
-                    else:
-                        processed[field] = article[field]
-                else:
-                    processed[field] = None
+                processed['word_count'] = int(word_count)
+            except (TypeError, ValueError):
+                processed['word_count'] = None
 
-        for field in self.fields:
-            if field in processed and processed[field] is None:
+        for field in self.required_fields:
+            if processed[field] is None:
                 raise FieldMissingError(f"Required field '{field}' is missing from article with id: {article.get('_id', 'unknown')}")
             
         return processed
     
-    def process_multiple_articles(self, articles, strict_mode = False):
+    def iter_processed_articles(self, articles, strict_mode = False):
         """
-        Process multiple articles and handle errors
+        Process multiple articles one at a time and handle errors
 
         Args:
-            articles (list): list of raw articles
+            articles (iterable): raw articles
             strict_mode (bool): if True, raise exception on first missing field
                                 if False, log error and continue
 
-        Returns:
-            list: processed articles
+        Yields:
+            dict: processed article data
         """
-
-        processed_articles = []
+        processed_count = 0
         errors = 0
 
         for i, article in enumerate(articles):
             try:
                 processed = self.process_article(article)
-                processed_articles.append(processed)
             except FieldMissingError as e:
                 errors += 1
                 if strict_mode:
                     raise
                 else:
                     logging.error(f"Skipping article {i+1}: {str(e)}")
+                continue
             except Exception as e:
                 errors += 1
                 logging.error(f"Error processing article {i+1}: {str(e)}")
                 if strict_mode:
                     raise
-        
-        logging.info(f"Processed {len(processed_articles)} articles successfully with {errors} errors")
-        return processed_articles
+                continue
+
+            processed_count += 1
+            yield processed
+
+        logging.info(f"Processed {processed_count} articles successfully with {errors} errors")
+
+    def process_multiple_articles(self, articles, strict_mode = False):
+        """
+        Process multiple articles and handle errors
+
+        Args:
+            articles (list): list of raw articles
+            strict_mode (bool): if True, raise exception on first missing field
+                                if False, log error and continue
+
+        Returns:
+            list: processed articles
+        """
+        return list(self.iter_processed_articles(articles, strict_mode))
+
+    def process_articles_dataframe(self, articles, strict_mode = False):
+        """
+        Process multiple articles column by column with pandas instead of one article at a time
+
+        Args:
+            articles (list): list of raw articles
+            strict_mode (bool): if True, raise exception on first missing field or malformed article
+                                if False, log error and drop those articles
+
+        Returns:
+            DataFrame: processed articles, with the same columns and values as process_article
+
+        Raises:
+            FieldMissingError: if a required field is missing and strict_mode is True
+            TypeError: if an article is not a dict and strict_mode is True
+        """
+        # Drop anything that isn't an article dict up front, the same way iter_processed_articles skips it
+        valid = []
+        positions = []
+        errors = 0
+
+        for i, article in enumerate(articles):
+            if isinstance(article, dict):
+                valid.append(article)
+                positions.append(i)
+                continue
+
+            errors += 1
+            error = TypeError(f"Expected an article dict, got {type(article).__name__}")
+            if strict_mode:
+                raise error
+            logging.error(f"Error processing article {i+1}: {str(error)}")
+
+        if not valid:
+            logging.info(f"Processed 0 articles successfully with {errors} errors")
+            return self._to_dataframe(pd.DataFrame(columns = self._OUTPUT_COLUMNS))
+
+        # One column per top level field, object dtype so ints with gaps aren't turned into floats
+        raw = pd.DataFrame(valid, columns = list(self.ALL_FIELDS), dtype = object)
+        df = pd.DataFrame(index = raw.index)
+
+        for out_key, (parent, *path) in self.NESTED_PATHS:
+            df[out_key] = raw[parent].map(_nested_getter(path))
+
+        df['keywords'] = raw['keywords'].map(self.join_keywords)
+
+        for field in self._OPTIONAL_FIELDS:
+            column = raw[field]
+            # Only columns holding dicts or lists need a per value pass to serialize them
+            if pd.api.types.infer_dtype(column, skipna = True) in ('mixed', 'mixed-integer'):
+                column = column.map(lambda v: _dumps(v) if isinstance(v, (dict, list)) else v)
+            df[field] = column
+
+        # Same cast as process_article, so an unparseable word count counts as missing
+        df['word_count'] = pd.to_numeric(df['word_count'], errors = 'coerce')
+
+        missing = df[list(self.required_fields)].isna()
+        invalid = missing.any(axis = 1)
+
+        for i in invalid[invalid].index:
+            field = missing.columns[missing.loc[i]][0]
+            error = FieldMissingError(f"Required field '{field}' is missing from article with id: {valid[i].get('_id', 'unknown')}")
+            if strict_mode:
+                raise error
+            logging.error(f"Skipping article {positions[i]+1}: {str(error)}")
+
+        errors += int(invalid.sum())
+        df = df[~invalid].reset_index(drop = True)
+
+        logging.info(f"Processed {len(df)} articles successfully with {errors} errors")
+        return self._to_dataframe(df)
+
+    def _to_dataframe(self, articles):
+        """
+        Build a DataFrame from processed articles with explicit column types instead of inferred object columns
+
+        Args:
+            articles (list or DataFrame): processed articles
+
+        Returns:
+            DataFrame: processed articles with typed columns
+        """
+        # Keep the raw values as objects so columns mixing ints and None aren't inferred as floats before the casts
+        df = articles if isinstance(articles, pd.DataFrame) else pd.DataFrame(articles, dtype = object)
+
+        # Frames built elsewhere may already hold ints with gaps as floats, turn them back into ints before writing them as text
+        df = df.astype({
+            column: 'Int64' for column in self._STRING_COLUMNS
+            if column in df.columns and pd.api.types.is_float_dtype(df[column]) and (df[column].dropna() % 1 == 0).all()
+        })
+
+        df = df.astype({column: STRING_DTYPE for column in self._STRING_COLUMNS if column in df.columns})
+
+        if 'word_count' in df.columns:
+            # Truncate like int() in process_article, Int32 refuses fractional values
+            df['word_count'] = np.trunc(pd.to_numeric(df['word_count'], errors = 'coerce')).astype('Int32')
+
+        if 'pub_date' in df.columns:
+            df['pub_date'] = pd.to_datetime(df['pub_date'], utc = True, errors = 'coerce', format = 'ISO8601')
+
+        return df
     
-    def save_to_csv(self, articles, filename = 'nyt_articles.csv'):
+    def save(self, articles, path, format = 'parquet', compression_level = None):
         """
-        Save processed articles to csv file
+        Save processed articles to a parquet, feather or csv file
+
+        Parquet and feather are written with zstd compression and keep column types, csv is only
+        written when asked for explicitly and gzip compressed if the path ends with .gz. A list of
+        processed articles is the fast path for csv: rows are written in batches by csv.DictWriter
+        without building a DataFrame.
+        Compression defaults to zstd level 3 and gzip level 1: higher levels only shrink the file
+        a little more but make writing several times slower
 
         Args:
-            articles (list): processed articles
-            filename (str): output filename
+            articles (list or DataFrame): processed articles
+            path (str): output filename
+            format (str): 'parquet', 'feather' or 'csv', default is 'parquet'
+            compression_level (int): overrides the default compression level of the format
+
+        Raises:
+            ValueError: if the format is not supported
         """
-        if not articles:
+        if format not in ('parquet', 'feather', 'csv'):
+            raise ValueError(f"Unsupported format '{format}', expected 'parquet', 'feather' or 'csv'")
+
+        if articles is None or len(articles) == 0:
             logging.warning('No articles to save')
             return
-        
+
+        try:
+            if format == 'csv' and not isinstance(articles, pd.DataFrame):
+                # Plain rows need no DataFrame operations before being written, so skip building one
+                self._write_csv(articles, path, compression_level)
+            else:
+                df = self._to_dataframe(articles)
+                if format == 'parquet':
+                    level = ZSTD_COMPRESSION_LEVEL if compression_level is None else compression_level
+                    df.to_parquet(path, compression = 'zstd', compression_level = level, index = False)
+                elif format == 'feather':
+                    level = ZSTD_COMPRESSION_LEVEL if compression_level is None else compression_level
+                    df.to_feather(path, compression = 'zstd', compression_level = level)
+                else:
+                    with _open_output(path, compression_level) as f:
+                        df.to_csv(f, index = False, date_format = PUB_DATE_FORMAT)
+            logging.info(f"Successfully saved {len(articles)} articles to {path}")
+        except Exception as e:
+            logging.error(f"Error saving to {format}: {str(e)}")
+            raise
+
+    def _write_csv(self, articles, filename, compression_level = None):
+        """
+        Write processed articles to csv file with csv.DictWriter in the column order of process_article
+
+        Args:
+            articles (iterable): processed articles
+            filename (str): output filename, gzip compressed if it ends with .gz
+            compression_level (int): gzip compression level, default is 1
+        """
+        rows = iter(articles)
+
+        # Format rows into an in-memory batch and hand each batch to the file in a single write
+        batch = io.StringIO()
+        writer = csv.DictWriter(batch, fieldnames = self._OUTPUT_COLUMNS, extrasaction = 'ignore', lineterminator = '\n')
+        writer.writeheader()
+
+        with _open_output(filename, compression_level) as f:
+            try:
+                while batch.tell():
+                    f.write(batch.getvalue())
+                    batch.seek(0)
+                    batch.truncate()
+                    writer.writerows(islice(rows, CSV_BATCH_SIZE))
+            finally:
+                # Keep the rows formatted so far if the input fails, e.g. when a later page can't be fetched
+                f.write(batch.getvalue())
+
+    def save_to_csv(self, articles, filename = 'nyt_articles.csv', compression_level = None):
+        """
+        Save processed articles to csv file, gzip compressed if the filename ends with .gz
+
+        Args:
+            articles (list or DataFrame): processed articles
+            filename (str): output filename
+            compression_level (int): gzip compression level, default is 1
+        """
+        self.save(articles, filename, format = 'csv', compression_level = compression_level)
+
+    def stream_to_csv(self, articles, filename = 'nyt_articles.csv', strict_mode = False, compression_level = None):
+        """
+        Process articles one at a time and append them to a csv file as they arrive
+
+        Only a batch of formatted rows is held in memory at a time, so this can be fed straight from iter_articles.
+        The target file is only replaced once the first processed article is available, so a run that
+        fails on its first request leaves the previous output in place
+
+        Args:
+            articles (iterable): raw articles, e.g. from iter_articles
+            filename (str): output filename, gzip compressed if it ends with .gz
+            strict_mode (bool): if True, raise exception on first missing field
+                                if False, log error and continue
+            compression_level (int): gzip compression level, default is 1
+        """
+        written = 0
+
+        def count_rows(rows):
+            nonlocal written
+            for row in rows:
+                written += 1
+                yield row
+
+        rows = count_rows(self.iter_processed_articles(articles, strict_mode))
+
         try:
-            df = pd.DataFrame(articles)
-            df.to_csv(filename, index = False, encoding = 'utf-8')
-            logging.info(f"Successfully saved {len(articles)} articles to {filename}")
+            first = next(rows, None)
+            rows = rows if first is None else chain([first], rows)
+            self._write_csv(rows, filename, compression_level)
         except Exception as e:
-            logging.error(f"Error saving to CSV: {str(e)}")
-            raise
\ No newline at end of file
+            logging.error(f"Error streaming articles to {filename} after {written} rows: {str(e)}")
+            raise
+
+        logging.info(f"Streamed {written} articles to {filename}")